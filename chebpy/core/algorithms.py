@@ -6,6 +6,7 @@ import warnings
 import numpy as np
 
 from chebpy.core.ffts import fft, ifft
+from chebpy.core.kernels import clenshaw_kernel
 from chebpy.core.utilities import Interval
 from chebpy.core.settings import DefaultPrefs
 from chebpy.core.decorators import preandpostprocess
@@ -130,8 +131,15 @@ def bary(xx, fk, xk, vk):
 
 @preandpostprocess
 def clenshaw(xx, ak):
-    """Clenshaw's algorithm for the evaluation of a first-kind Chebyshev 
+    """Clenshaw's algorithm for the evaluation of a first-kind Chebyshev
     series expansion at some array of points x"""
+    # use the compiled kernel for real input if numba is available: it gives
+    # the same results as the loop below, and is faster for all sizes
+    if clenshaw_kernel is not None and np.isrealobj(xx) and np.isrealobj(ak):
+        xx = np.asarray(xx, dtype=float)
+        out = np.empty(xx.shape)
+        clenshaw_kernel(xx.ravel(), np.asarray(ak, dtype=float), out.ravel())
+        return out
     bk1 = 0*xx
     bk2 = 0*xx
     xx = 2*xx
@@ -54,12 +54,12 @@ class Chebfun(object):
                 raise BadFunLengthArgument
         if domain.size < 2:
             raise BadDomainArgument
-        funs = np.array([])
+        funs = []
         intervals = zip(domain[:-1], domain[1:])
         for interval, length in zip(intervals, nn):
             interval = Interval(*interval)
             fun = Bndfun.initfun_fixedlen(f, interval, length)
-            funs = np.append(funs, fun)
+            funs.append(fun)
         return cls(funs)
 
     # --------------------
@@ -73,28 +73,52 @@ class Chebfun(object):
     def __call__(self, x):
 
         # initialise output
-        out = np.full(x.size, np.nan)
-
-        # evaluate a fun when x is an interior point
-        for fun in self:
-            idx = fun.interval.isinterior(x)
-            out[idx] = fun(x[idx])
-
-        # evaluate the breakpoint data for x at a breakpoint
+        out = np.empty(x.size)
         breakpoints = self.breakpoints
-        for breakpoint in breakpoints:
-            out[x==breakpoint] = self.breakdata[breakpoint]
+        breakvalues = self._breakvalues
+        nfuns = self.funs.size
+
+        # for very few points it is cheapest to evaluate them one at a time
+        if x.size <= 4:
+            for i, xi in enumerate(x):
+                k = np.searchsorted(breakpoints, xi, side='right') - 1
+                if k >= 0 and breakpoints[k] == xi:
+                    out[i] = breakvalues[k]
+                else:
+                    out[i] = self.funs[min(max(k, 0), nfuns-1)](xi)
+            return out
+
+        # with a single fun there is nothing to group: evaluate it directly
+        # and then fix up any x at either of the two breakpoints
+        if nfuns == 1:
+            out[:] = self.funs[0](x)
+            for bp, bv in zip(breakpoints, breakvalues):
+                out[x == bp] = bv
+            return out
+
+        # locate each x relative to the breakpoints, i.e., the index k such
+        # that breakpoints[k] <= x < breakpoints[k+1], and -1 to the left
+        bpidx = np.searchsorted(breakpoints, x, side='right') - 1
+
+        # assign each x to the index of the fun whose interval contains it;
+        # the first and last funs are used to evaluate outside of the
+        # chebfun domain
+        idx = np.clip(bpidx, 0, nfuns-1)
+
+        # group the points by fun and evaluate each fun exactly once
+        order = np.argsort(idx, kind='mergesort')
+        splits = np.flatnonzero(np.diff(idx[order])) + 1
+        for pts in np.split(order, splits):
+            if pts.size > 0:
+                out[pts] = self.funs[idx[pts[0]]](x[pts])
 
-        # first and last funs used to evaluate outside of the chebfun domain
-        lpts, rpts = x < breakpoints[0], x > breakpoints[-1]
-        out[lpts] = self.funs[0](x[lpts])
-        out[rpts] = self.funs[-1](x[rpts])
+        # evaluate the breakpoint data for x at a breakpoint
+        atbpt = (bpidx >= 0) & (breakpoints[np.maximum(bpidx, 0)] == x)
+        out[atbpt] = breakvalues[bpidx[atbpt]]
         return out
 
     def __init__(self, funs):
-        self.funs = check_funs(funs)
-        self.breakdata = compute_breakdata(self.funs)
-        self.transposed = False
+        self._setfuns(check_funs(funs))
 
     def __iter__(self):
         return self.funs.__iter__()
@@ -131,16 +155,15 @@ class Chebfun(object):
             .format(rowcol, numpcs, plural)
         toprow = '       interval       length     endpoint values\n'
         tmplat = '[{:8.2g},{:8.2g}]   {:6}  {:8.2g} {:8.2g}\n'
-        rowdta = ''
-        for fun in self:
-            endpts = fun.support
-            xl, xr = endpts
-            fl, fr = fun(endpts)
-            row = tmplat.format(xl, xr, fun.size, fl, fr)
-            rowdta += row
+        endpts = np.array([fun.support for fun in self])
+        endvals = np.array([fun(x) for fun, x in zip(self, endpts)])
+        sizes = np.fromiter((fun.size for fun in self), dtype=int,
+                            count=numpcs)
+        rowdta = ''.join(tmplat.format(xl, xr, n, fl, fr) for
+            (xl, xr), n, (fl, fr) in zip(endpts, sizes, endvals))
         btmrow = 'vertical scale = {:3.2g}'.format(self.vscale)
         btmxtr = '' if numpcs == 1 else \
-            '    total length = {}'.format(sum([f.size for f in self]))
+            '    total length = {}'.format(sizes.sum())
         return header + toprow + rowdta + btmrow + btmxtr
 
     def __rsub__(self, f):
@@ -170,6 +193,31 @@ class Chebfun(object):
     # ------------------
     #  internal helpers
     # ------------------
+    @classmethod
+    def _initsorted(cls, funs):
+        '''Initialise a Chebfun from a collection of funs which is already
+        known to be sorted and to partition the domain, for instance the funs
+        of an existing Chebfun after an operation that leaves the interval of
+        each fun unchanged. This skips the checks performed in check_funs.'''
+        out = cls.__new__(cls)
+        out._setfuns(np.array(funs))
+        return out
+
+    def _setfuns(self, funs):
+        '''Set the funs of self along with the data derived from them'''
+        self.funs = funs
+        self.breakdata = compute_breakdata(self.funs)
+        self.transposed = False
+        # the breakpoints and their values are read on every evaluation, so
+        # we build these arrays once here rather than from breakdata on each
+        # access
+        n = len(self.breakdata)
+        self._breakpoints = np.fromiter(self.breakdata.keys(), dtype=float,
+                                        count=n)
+        self._breakvalues = np.fromiter(self.breakdata.values(), dtype=float,
+                                        count=n)
+        self._breakpoints.flags.writeable = False
+
     @self_empty()
     def _apply_binop(self, f, op):
         '''Funnel method used in the implementation of Chebfun binary
@@ -225,7 +273,7 @@ class Chebfun(object):
     # ------------
     @property
     def breakpoints(self):
-        return np.array([x for x in self.breakdata.keys()])
+        return self._breakpoints
 
     @property
     @self_empty(np.array([]))
@@ -235,9 +283,13 @@ class Chebfun(object):
 
     @property
     @self_empty(Domain([]))
+    @cache
     def support(self):
         '''Return an array containing the first and last breakpoints'''
-        return Domain(self.breakpoints[[0,-1]])
+        # the cached array is handed to every caller, so make it read-only
+        support = Domain(self.breakpoints[[0,-1]])
+        support.flags.writeable = False
+        return support
 
     @property
     @self_empty(0.)
@@ -292,40 +344,33 @@ class Chebfun(object):
     def roots(self):
         '''Compute the roots of a Chebfun, i.e., the set of values x for which
         f(x) = 0.'''
-        allrts = []
-        prvrts = np.array([])
+        allrts = [fun.roots() for fun in self]
+        rts = np.concatenate(allrts)
+        # index of the fun from which each root originates
+        pcs = np.repeat(np.arange(len(allrts)), [x.size for x in allrts])
+        # ignore the first root of each fun if equal to the last root of the
+        # previous fun
+        # TODO: there could be multiple roots at breakpoints
         htol = 1e2 * self.hscale * DefaultPrefs.eps
-        for fun in self:
-            rts = fun.roots()
-            # ignore first root if equal to the last root of previous fun
-            # TODO: there could be multiple roots at breakpoints
-            if prvrts.size > 0 and rts.size > 0:
-                if abs(prvrts[-1]-rts[0]) <= htol:
-                    rts = rts[1:]
-            allrts.append(rts)
-            prvrts = rts
-        return np.concatenate([x for x in allrts])
+        keep = np.ones(rts.size, dtype=bool)
+        keep[1:] = (np.diff(pcs) != 1) | (np.abs(np.diff(rts)) > htol)
+        return rts[keep]
 
     # ----------
     #  calculus
     # ----------
     def cumsum(self):
-        newfuns = []
-        prevfun = None
-        for fun in self:
-            integral = fun.cumsum()
-            if prevfun:
-                # enforce continuity by adding the function value
-                # at the right endpoint of the previous fun
-                _, fb = prevfun.endvalues
-                integral = integral + fb
-            newfuns.append(integral)
-            prevfun = integral
+        newfuns = [fun.cumsum() for fun in self]
+        # enforce continuity by adding to each indefinite integral the sum of
+        # the definite integrals of the funs to its left
+        carries = np.cumsum([fun.sum() for fun in self.funs[:-1]])
+        for k, carry in enumerate(carries, 1):
+            newfuns[k] = newfuns[k] + carry
         return self.__class__(newfuns)
 
     def diff(self):
-        dfuns = np.array([fun.diff() for fun in self])
-        return self.__class__(dfuns)
+        dfuns = [fun.diff() for fun in self]
+        return self._initsorted(dfuns)
 
     def sum(self):
         return np.sum([fun.sum() for fun in self])
@@ -338,9 +383,16 @@ class Chebfun(object):
     # ----------
     def plot(self, ax=None, *args, **kwargs):
         ax = ax or plt.gca()
-        a, b = self.support
-        xx = np.linspace(a, b, 2001)
-        ax.plot(xx, self(xx), *args, **kwargs)
+        # sample each fun directly on its own interval, which avoids locating
+        # the points among the funs in __call__
+        npts = max(200, 2001//self.funs.size)
+        xx, yy = [], []
+        for fun in self:
+            a, b = fun.support
+            x = np.linspace(a, b, npts)
+            xx.append(x)
+            yy.append(fun(x))
+        ax.plot(np.concatenate(xx), np.concatenate(yy), *args, **kwargs)
         return ax
 
     def plotcoeffs(self, ax=None, *args, **kwargs):
@@ -382,14 +434,14 @@ class Chebfun(object):
         keys = .5 * ((-1) ** np.arange(switch.size-1) + 1)
         if comparator(other(switch[0]), self(switch[0])):
             keys = 1 - keys
-        funs = np.array([])
+        funs = []
         for interval, use_self in zip(switch.intervals, keys):
             subdom = newdom.restrict(interval)
             if use_self:
                 subfun = self.restrict(subdom)
             else:
                 subfun = other.restrict(subdom)
-            funs = np.append(funs, subfun.funs)
+            funs.extend(subfun.funs)
         return self.__class__(funs)
 
 # ---------
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# compiled versions of the inner loops of some of the routines in
+# algorithms.py, built via numba if the user has it installed. Otherwise the
+# kernels are set to None and the callers default to their numpy
+# implementations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is None:
+    clenshaw_kernel = None
+else:
+    @njit(cache=True)
+    def clenshaw_kernel(xx, ak, out):
+        """Clenshaw's algorithm for real first-kind Chebyshev coefficients ak,
+        evaluated at each of the 1D array of points xx and written to out.
+        The recurrence runs over the coefficients in the outer loop and over
+        the points in the inner one, performing the same operations in the
+        same order as algorithms.clenshaw so that the two agree exactly."""
+        n = ak.size
+        m = xx.size
+        x2 = np.empty(m)
+        bk1 = np.empty(m)
+        bk2 = np.empty(m)
+        for i in range(m):
+            bk1[i] = 0. * xx[i]
+            bk2[i] = bk1[i]
+            x2[i] = 2. * xx[i]
+        for k in range(n-1, 1, -2):
+            for i in range(m):
+                bk2[i] = ak[k] + x2[i]*bk1[i] - bk2[i]
+            for i in range(m):
+                bk1[i] = ak[k-1] + x2[i]*bk2[i] - bk1[i]
+        if (n-1) % 2 == 1:
+            for i in range(m):
+                tmp = ak[1] + x2[i]*bk1[i] - bk2[i]
+                bk2[i] = bk1[i]
+                bk1[i] = tmp
+        for i in range(m):
+            out[i] = ak[0] + .5*x2[i]*bk1[i] - bk2[i]
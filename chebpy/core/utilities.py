@@ -2,7 +2,6 @@
 
 from __future__ import division
 
-import collections
 import numpy as np
 
 from chebpy.core.settings import DefaultPrefs
@@ -33,15 +32,34 @@ class Interval(np.ndarray):
     Currently only implemented for finite a and b.
     """
 
+    __slots__ = ('_a', '_b')
+
     def __new__(cls, a=-1., b=1.):
         if a >= b:
             raise IntervalValues
+        return cls._unchecked(a, b)
+
+    @classmethod
+    def _unchecked(cls, a, b):
+        """Construct an Interval without checking that a < b, for use where
+        this is already guaranteed, e.g., between adjacent breakpoints of a
+        Domain"""
         self = np.asarray((a,b), dtype=float).view(cls)
-        self.formap = lambda y: .5*b*(y+1.) + .5*a*(1.-y)
-        self.invmap = lambda x: (2.*x-a-b) / (b-a)
-        self.drvmap = lambda y: 0.*y + .5*(b-a)
+        self._a, self._b = a, b
         return self
 
+    def formap(self, y):
+        a, b = self._a, self._b
+        return .5*b*(y+1.) + .5*a*(1.-y)
+
+    def invmap(self, x):
+        a, b = self._a, self._b
+        return (2.*x-a-b) / (b-a)
+
+    def drvmap(self, y):
+        a, b = self._a, self._b
+        return 0.*y + .5*(b-a)
+
     def __eq__(self, other):
         (a,b), (x,y) = self, other
         return (a==x) & (y==b)
@@ -54,7 +72,7 @@ class Interval(np.ndarray):
 
     def __contains__(self, other):
         (a,b), (x,y) = self, other
-        return (a<=x) & (y<=b)
+        return (a<=x) and (y<=b)
 
     def isinterior(self, x):
         a,b = self
@@ -74,8 +92,13 @@ def _merge_duplicates(arr, tols):
 class Domain(np.ndarray):
     """Numpy ndarray, with additional Chebfun-specific domain logic"""
 
+    __slots__ = ()
+
     def __new__(cls, breakpoints):
-        bpts = np.asarray(breakpoints, dtype=float)
+        try:
+            bpts = np.asarray(breakpoints, dtype=float)
+        except (TypeError, ValueError):
+            raise InvalidDomain
         if bpts.size == 0:
             return bpts.view(cls)
         elif bpts.size < 2 or np.any(np.diff(bpts)<=0):
@@ -95,14 +118,18 @@ class Domain(np.ndarray):
     @classmethod
     def from_chebfun(cls, chebfun):
         """Initialise a Domain object from a Chebfun"""
-        return cls(chebfun.breakpoints)
+        # copy, since the chebfun's breakpoints are read-only internal state
+        return cls(chebfun.breakpoints.copy())
 
     @property
     def intervals(self):
         """Iterate across adajacent pairs of breakpoints, yielding an interval
         object."""
-        for a,b in zip(self[:-1], self[1:]):
-            yield Interval(a,b)
+        # iterate over the rows of a (n-1,2) array of endpoint pairs, converted
+        # to Python floats in a single call
+        pairs = np.column_stack((self[:-1], self[1:])).tolist()
+        for a,b in pairs:
+            yield Interval._unchecked(a,b)
 
     @property
     def support(self):
@@ -113,17 +140,23 @@ class Domain(np.ndarray):
     def union(self, other):
         """Union of two domain objects with an initial check that the support
         of each object matches"""
-        dspt = np.abs(self.support-other.support)
-        htol = np.maximum(HTOL, HTOL*np.abs(self.support))
-        if np.any(dspt>htol):
-            raise SupportMismatch
+        spt1, spt2 = self.support, other.support
+        if not np.array_equal(spt1, spt2):
+            dspt = np.abs(spt1-spt2)
+            htol = np.maximum(HTOL, HTOL*np.abs(spt1))
+            if np.any(dspt>htol):
+                raise SupportMismatch
         return self.merge(other)
 
     def merge(self, other):
         """Merge two domain objects without checking first whether they have
         the same support"""
+        # both sets of breakpoints are typically already sorted, in which case
+        # a stable sort of their concatenation is a linear-time merge of two
+        # runs; exact duplicates are then removed by _merge_duplicates along
+        # with the near ones
         all_bpts = np.append(self, other)
-        new_bpts = np.unique(all_bpts)
+        new_bpts = np.sort(all_bpts, kind='mergesort')
         mergetol = np.maximum(HTOL, HTOL*np.abs(new_bpts))
         mgd_bpts = _merge_duplicates(new_bpts, mergetol)
         return self.__class__(mgd_bpts)
@@ -160,6 +193,8 @@ class Domain(np.ndarray):
         objects"""
         if self.size != other.size:
             return False
+        elif np.array_equal(self, other):
+            return True
         else:
             dbpt = np.abs(self-other)
             htol = np.maximum(HTOL, HTOL*np.abs(self))
@@ -176,18 +211,18 @@ def _sortindex(intervals):
     approximation domain"""
 
     # sort by the left endpoint Interval values
-    subintervals = np.array([x for x in intervals])
-    leftbreakpts = np.array([s[0] for s in subintervals])
-    idx = leftbreakpts.argsort()
+    subintervals = np.array(list(intervals), dtype=float)
+    idx = subintervals[:,0].argsort(kind='mergesort')
 
-    # check domain consistency
+    # check domain consistency: d is the difference between the left
+    # endpoint of each subinterval and the right endpoint of its predecessor
     srt = subintervals[idx]
-    x = srt.flatten()[1:-1]
-    d = x[1::2] - x[::2]
-    if (d<0).any():
-        raise IntervalOverlap
-    if (d>0).any():
-        raise IntervalGap
+    d = srt[1:,0] - srt[:-1,1]
+    if d.size > 0:
+        if d.min() < 0:
+            raise IntervalOverlap
+        if d.max() > 0:
+            raise IntervalGap
 
     return idx
 
@@ -211,21 +246,23 @@ def compute_breakdata(funs):
     left and right limits. This method is called after check_funs() and
     thus at the point of calling we are guaranteed to have a fully partitioned
     and nonoverlapping domain."""
-    if funs.size == 0:
-        return collections.OrderedDict()
+    n = funs.size
+    if n == 0:
+        return {}
     else:
-        points = np.array([fun.support for fun in funs])
-        values = np.array([fun.endvalues for fun in funs])
-        points = points.flatten()
-        values = values.flatten()
-        xl, xr = points[0], points[-1]
-        yl, yr = values[0], values[-1]
-        xx, yy = points[1:-1], values[1:-1]
-        x = .5 * (xx[::2] + xx[1::2])
-        y = .5 * (yy[::2] + yy[1::2])
-        xout = np.append(np.append(xl, x), xr)
-        yout = np.append(np.append(yl, y), yr)
-        return collections.OrderedDict(zip(xout, yout))
+        points = np.empty((n,2))
+        values = np.empty((n,2))
+        for k, fun in enumerate(funs):
+            points[k] = fun.support
+            values[k] = fun.endvalues
+        xout = np.empty(n+1)
+        yout = np.empty(n+1)
+        xout[0], xout[-1] = points[0,0], points[-1,1]
+        yout[0], yout[-1] = values[0,0], values[-1,1]
+        xout[1:-1] = .5 * (points[:-1,1] + points[1:,0])
+        yout[1:-1] = .5 * (values[:-1,1] + values[1:,0])
+        # dicts preserve insertion order, so the keys remain sorted
+        return dict(zip(xout.tolist(), yout.tolist()))
 
 
 def generate_funs(domain, bndfun_constructor, arglist=[]):
@@ -234,10 +271,10 @@ def generate_funs(domain, bndfun_constructor, arglist=[]):
     domain = np.array(domain)
     if domain.size < 2:
         raise BadDomainArgument
-    funs = np.array([])
+    funs = []
     for interval in zip(domain[:-1], domain[1:]):
         interval = Interval(*interval)
         args = arglist + [interval]
         fun = bndfun_constructor(*args)
-        funs = np.append(funs, fun)
-    return funs
+        funs.append(fun)
+    return np.array(funs)
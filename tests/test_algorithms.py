@@ -9,7 +9,9 @@ import numpy as np
 
 from chebpy.core.settings import DefaultPrefs
 from chebpy.core.chebtech import Chebtech2
+from chebpy.core import algorithms
 from chebpy.core.algorithms import bary, clenshaw, coeffmult
+from chebpy.core.kernels import clenshaw_kernel
 
 from tests.utilities import (testfunctions, scaled_tol, infNormLessThanTol,
                              infnorm)
@@ -85,6 +87,28 @@ class Evaluation(unittest.TestCase):
         self.assertTrue(isinstance(ff(0, "clenshaw"), float))
         self.assertTrue(isinstance(gg(0, "clenshaw"), float))
 
+    # check the compiled Clenshaw kernel against numpy's implementation
+    @unittest.skipIf(clenshaw_kernel is None, "numba is not installed")
+    def test_clenshaw_kernel(self):
+        out = np.empty(self.pts.size)
+        clenshaw_kernel(self.pts, self.ak, out)
+        vals = np.polynomial.chebyshev.chebval(self.pts, self.ak)
+        tol = 1e1 * eps * np.abs(self.ak).sum()
+        self.assertLessEqual(infnorm(out-vals), tol)
+
+    # check that clenshaw gives exactly the same results whether or not it
+    # dispatches to the compiled kernel
+    @unittest.skipIf(clenshaw_kernel is None, "numba is not installed")
+    def test_clenshaw_kernel_vs_numpy(self):
+        for ak in (self.ak, self.ak[:-1]):
+            fast = clenshaw(self.pts, ak)
+            algorithms.clenshaw_kernel = None
+            try:
+                slow = clenshaw(self.pts, ak)
+            finally:
+                algorithms.clenshaw_kernel = clenshaw_kernel
+            self.assertTrue(np.array_equal(fast, slow))
+
     # Check that we get consistent output from bary and clenshaw
     # TODO: Move these tests elsewhere?
     def test_bary_clenshaw_consistency(self):
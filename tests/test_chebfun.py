@@ -211,6 +211,12 @@ class Properties(unittest.TestCase):
         self.assertEqual(self.f1.domain, d1)
         self.assertEqual(self.f2.domain, d2)
 
+    # the domain is a new object which does not share the breakpoints
+    def test_domain_copy(self):
+        dom = self.f2.domain
+        dom[0] = -2.
+        self.assertTrue(np.equal(self.f2.breakpoints,[-1,0,1,2]).all())
+
     def test_hscale(self):
         self.assertIsInstance(self.f0.hscale, np.float)
         self.assertIsInstance(self.f1.hscale, np.float)
@@ -241,6 +247,12 @@ class Properties(unittest.TestCase):
         self.assertTrue(np.equal(self.f1.support,[-1,1]).all())
         self.assertTrue(np.equal(self.f2.support,[-1,2]).all())
 
+    # the cached support must not be modifiable through a returned reference
+    def test_support_readonly(self):
+        support = self.f2.support
+        self.assertRaises(ValueError, support.__setitem__, 1, 10.)
+        self.assertTrue(np.equal(self.f2.support,[-1,2]).all())
+
     def test_vscale(self):
         self.assertEqual(self.f0.vscale, 0)
         self.assertEqual(self.f1.vscale, 1)
@@ -786,6 +798,16 @@ class Evaluation(unittest.TestCase):
         self.assertLessEqual(infnorm(f(x2)-ff2(x2)), 2e1*eps)
         self.assertLessEqual(infnorm(f(x3)-ff3(x3)), 5e1*eps)
 
+    def test__call__pointwise_evaluation(self):
+        # check that evaluating a few points at a time gives the same output
+        # as evaluating the whole array at once
+        x = np.array([-1.5, -1, -.5, 0, .5, 1, 1.5, 2, 2.5])
+        vals = self.f2(x)
+        for k in range(x.size):
+            self.assertEqual(self.f2(x[k]), vals[k])
+        for k in range(0, x.size, 3):
+            self.assertTrue(np.equal(self.f2(x[k:k+3]), vals[k:k+3]).all())
+
 
 class Calculus(unittest.TestCase):
 
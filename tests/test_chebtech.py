@@ -4,17 +4,18 @@
 
 from __future__ import division
 
+import functools
 import itertools
 import operator
 import unittest
 import numpy as np
-import matplotlib.pyplot as plt
+from numpy.polynomial.chebyshev import chebval
+from matplotlib.figure import Figure
 
 from chebpy.core.settings import DefaultPrefs
 from chebpy.core.chebtech import Chebtech2
 from chebpy.core.algorithms import standard_chop
-from tests.utilities import (testfunctions, infnorm, scaled_tol,
-                             infNormLessThanTol)
+from tests.utilities import testfunctions, infnorm, scaled_tol
 
 np.random.seed(0)
 
@@ -26,13 +27,46 @@ exp = np.exp
 eps = DefaultPrefs.eps
 _vals2coeffs = Chebtech2._vals2coeffs
 _coeffs2vals = Chebtech2._coeffs2vals
+_chebpts = Chebtech2._chebpts
+
+# the tests below build the same chebtechs many times over, so memoise them
+# by function (and length)
+@functools.lru_cache(maxsize=None)
+def _get_fixedlen(fun, n):
+    return Chebtech2.initfun_fixedlen(fun, n)
+
+@functools.lru_cache(maxsize=None)
+def _get_adaptive(fun):
+    return Chebtech2.initfun_adaptive(fun)
+
+# a single empty chebtech shared by the tests which only read from one
+_EMPTY = Chebtech2(np.array([]))
+
+# sizes of the vals2coeffs/coeffs2vals round-trip tests, along with some
+# random data shared by them: each size uses a view of the first n entries
+# rather than drawing n new random numbers
+roundtrip_sizes = 2**np.arange(2,18,2)+1
+randpool = np.random.rand(roundtrip_sizes.max())
+
+# evaluation points in [-1,1] shared by the test classes, taken from the
+# same pool of random data
+xxpool = -1 + 2*randpool[-1000:]
+
+# second-kind Chebyshev points: (number of points, expected values, tolerance)
+chebpts2_testlist = (
+    (1, np.array([0.]), eps),
+    (2, np.array([-1., 1.]), eps),
+    (3, np.array([-1., 0., 1.]), eps),
+    (4, np.array([-1., -.5, .5, 1.]), 2*eps),
+    (5, np.array([-1., -2.**(-.5), 0., 2.**(-.5), 1.]), eps),
+)
 
 # ------------------------
 class ChebyshevPoints(unittest.TestCase):
     """Unit-tests for Chebtech2"""
 
     def test_chebpts_0(self):
-        self.assertEquals(Chebtech2._chebpts(0).size, 0)
+        self.assertEquals(_chebpts(0).size, 0)
             
     def test_vals2coeffs_empty(self):
         self.assertEquals(_vals2coeffs(np.array([])).size, 0)
@@ -52,83 +86,100 @@ class ChebyshevPoints(unittest.TestCase):
             ak = np.array([k])
             self.assertLessEqual(infnorm(_coeffs2vals(ak)-ak), eps)
 
+    # check the mutually inverse nature of vals2coeffs and coeffs2vals
+    def test_vals2coeffs2vals(self):
+        for n in roundtrip_sizes:
+            with self.subTest(n=n):
+                values = randpool[:n]
+                _values_ = _coeffs2vals(_vals2coeffs(values))
+                self.assertLessEqual(infnorm(values-_values_), scaled_tol(n))
+
+    def test_coeffs2vals2coeffs(self):
+        for n in roundtrip_sizes:
+            with self.subTest(n=n):
+                coeffs = randpool[:n]
+                _coeffs_ = _vals2coeffs(_coeffs2vals(coeffs))
+                self.assertLessEqual(infnorm(coeffs-_coeffs_), scaled_tol(n))
+
+    # cross-check coeffs2vals against numpy's own Chebyshev series evaluation
+    # (this is O(n^2), so only the smaller round-trip sizes are used, and
+    # the rounding errors of its recurrence grow like n^2 near the endpoints)
+    def test_coeffs2vals_chebval(self):
+        for n in roundtrip_sizes[roundtrip_sizes<=1025]:
+            with self.subTest(n=n):
+                coeffs = randpool[:n]
+                vals = chebval(_chebpts(n), coeffs)
+                tol = n**2 * eps * np.abs(coeffs).sum()
+                self.assertLessEqual(infnorm(_coeffs2vals(coeffs)-vals), tol)
+
+    def test_chebpts(self):
+        for n, pts, tol in chebpts2_testlist:
+            with self.subTest(n=n):
+                self.assertLessEqual(infnorm(_chebpts(n)-pts), tol)
+
+    # check the output is of the correct length, the endpoint values are -1
+    # and 1, respectively, and that the sequence is monotonically increasing
+    def test_chebpts_len(self):
+        for n in 2**np.arange(2,18,2)+3:
+            with self.subTest(n=n):
+                pts = _chebpts(n)
+                self.assertEquals(pts.size, n)
+                self.assertEquals(pts[0], -1.)
+                self.assertEquals(pts[-1], 1.)
+                self.assertTrue(np.all(np.diff(pts) > 0))
+
     # TODO: further checks for chepbts
 
-# ------------------------------------------------------------------------
-# Tests to verify the mutually inverse nature of vals2coeffs and coeffs2vals
-# ------------------------------------------------------------------------
-def vals2coeffs2valsTester(n):
-    def asserter(self):
-        values = np.random.rand(n)
-        coeffs = _vals2coeffs(values)
-        _values_ = _coeffs2vals(coeffs)
-        self.assertLessEqual( infnorm(values-_values_), scaled_tol(n) )
-    return asserter
-
-def coeffs2vals2coeffsTester(n):
-    def asserter(self):
-        coeffs = np.random.rand(n)
-        values = _coeffs2vals(coeffs)
-        _coeffs_ = _vals2coeffs(values)
-        self.assertLessEqual( infnorm(coeffs-_coeffs_), scaled_tol(n) )
-    return asserter
-
-for k, n in enumerate(2**np.arange(2,18,2)+1):
-
-    # vals2coeffs2vals
-    _testfun_ = vals2coeffs2valsTester(n)
-    _testfun_.__name__ = "test_vals2coeffs2vals_{:02}".format(k)
-    setattr(ChebyshevPoints, _testfun_.__name__, _testfun_)
-
-    # coeffs2vals2coeffs
-    _testfun_ = coeffs2vals2coeffsTester(n)
-    _testfun_.__name__ = "test_coeffs2vals2coeffs_{:02}".format(k)
-    setattr(ChebyshevPoints, _testfun_.__name__, _testfun_)
-# ------------------------------------------------------------------------
-   
-# ------------------------------------------------------------------------
-# Add second-kind Chebyshev points test cases to ChebyshevPoints
-# ------------------------------------------------------------------------
-chebpts2_testlist = (
-    (Chebtech2._chebpts(1), np.array([0.]), eps),
-    (Chebtech2._chebpts(2), np.array([-1., 1.]), eps),
-    (Chebtech2._chebpts(3), np.array([-1., 0., 1.]), eps),
-    (Chebtech2._chebpts(4), np.array([-1., -.5, .5, 1.]), 2*eps),
-    (Chebtech2._chebpts(5), np.array([-1., -2.**(-.5), 0., 2.**(-.5), 1.]), eps),
-)
-for k, (a,b,tol) in enumerate(chebpts2_testlist):
-    _testfun_ = infNormLessThanTol(a,b,tol)
-    _testfun_.__name__ = "test_chebpts_{:02}".format(k+1)
-    setattr(ChebyshevPoints, _testfun_.__name__, _testfun_)
-
-# check the output is of the correct length, the endpoint values are -1
-# and 1, respectively, and that the sequence is monotonically increasing
-def chebptsLenTester(k):
-    def asserter(self):
-        pts = Chebtech2._chebpts(k)
-        self.assertEquals(pts.size, k)
-        self.assertEquals(pts[0], -1.)
-        self.assertEquals(pts[-1], 1.)
-        self.assertTrue(np.all(np.diff(pts))>0)
-    return asserter
-    
-for k, n in enumerate(2**np.arange(2,18,2)):
-    _testfun_ = chebptsLenTester(n+3)
-    _testfun_.__name__ = "test_chebpts_len_{:02}".format(k)
-    setattr(ChebyshevPoints, _testfun_.__name__, _testfun_)
-# ------------------------------------------------------------------------
 
 
+# reference functions appearing in more than one of the tables below: using
+# the same function objects lets the chebtech cache hit across the tables
+_const = lambda x: 0*x+1.
+_x = lambda x: x
+_x2 = lambda x: x**2
+_x3 = lambda x: x**3
+_x4 = lambda x: x**4
+_x5 = lambda x: x**5
+_sin = lambda x: sin(x)
+_cos = lambda x: cos(x)
+_cos3 = lambda x: cos(3*x)
+_sin4pi = lambda x: sin(4*pi*x)
+_cos4pi = lambda x: cos(4*pi*x)
+_cos3244 = lambda x: cos(3244*x)
+_exp = lambda x: exp(x)
+_exp1e10 = lambda x: 1e10*exp(x)
+
+# --------------------------------------
+#          vscale estimates
+# --------------------------------------
+vscales = [
+    # (function, number of points, vscale)
+    (_sin4pi,                      40, 1),
+    (_cos,                         15, 1),
+    (_cos4pi,                      39, 1),
+    (lambda x: exp(cos(4*pi*x)),  181, exp(1)),
+    (_cos3244,                   3389, 1),
+    (_exp,                         15, exp(1)),
+    (_exp1e10,                     15, 1e10*exp(1)),
+    (_const,                        1, 1),
+]
+
 class ClassUsage(unittest.TestCase):
     """Unit-tests for miscelaneous Chebtech2 class usage"""
 
-    def setUp(self):
-        self.ff = Chebtech2.initfun_fixedlen(lambda x: np.sin(30*x), 100)
-        self.xx = -1 + 2*np.random.rand(100)
+    emptyfun = _EMPTY
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ff = Chebtech2.initfun_fixedlen(lambda x: np.sin(30*x), 100)
+        cls.xx = xxpool[:100]
+        # evaluations shared by the tests which compare them
+        cls._ff_bary = cls.ff(cls.xx, "bary")
+        cls._ff_clen = cls.ff(cls.xx, "clenshaw")
 
     # tests for emptiness of Chebtech2 objects
     def test_isempty_True(self):
-        f = Chebtech2(np.array([]))
+        f = self.emptyfun
         self.assertTrue(f.isempty)
         self.assertFalse(not f.isempty)
 
@@ -144,45 +195,43 @@ class ClassUsage(unittest.TestCase):
         self.assertFalse(not f.isconst)
 
     def test_isconst_False(self):
-        f = Chebtech2(np.array([]))
+        f = self.emptyfun
         self.assertFalse(f.isconst)
         self.assertTrue(not f.isconst)
 
     # check the size() method is working properly
     def test_size(self):
         cfs = np.random.rand(10)
-        self.assertEquals(Chebtech2(np.array([])).size, 0)
+        self.assertEquals(self.emptyfun.size, 0)
         self.assertEquals(Chebtech2(np.array([1.])).size, 1)
         self.assertEquals(Chebtech2(cfs).size, cfs.size)
 
-    # test the different permutations of self(xx, ..)
+    # test the different permutations of self(xx, ..); the positional forms
+    # were evaluated in setUpClass
     def test_call(self):
-        self.ff(self.xx)
+        self.assertEqual(infnorm(self.ff(self.xx)-self._ff_clen), 0)
 
     def test_call_bary(self):
-        self.ff(self.xx, "bary")
-        self.ff(self.xx, how="bary")
+        self.assertEqual(infnorm(self.ff(self.xx, how="bary")-self._ff_bary), 0)
 
     def test_call_clenshaw(self):
-        self.ff(self.xx, "clenshaw")
-        self.ff(self.xx, how="clenshaw")
+        self.assertEqual(
+            infnorm(self.ff(self.xx, how="clenshaw")-self._ff_clen), 0)
 
     def test_call_bary_vs_clenshaw(self):
-        b = self.ff(self.xx, "clenshaw")
-        c = self.ff(self.xx, "bary")
-        self.assertLessEqual(infnorm(b-c), 5e1*eps)
+        self.assertLessEqual(infnorm(self._ff_clen-self._ff_bary), 5e1*eps)
 
     def test_call_raises(self):
-        self.assertRaises(ValueError, self.ff, self.xx, "notamethod")
-        self.assertRaises(ValueError, self.ff, self.xx, how="notamethod")
+        for args, kwargs in [((self.xx, "notamethod"), {}),
+                             ((self.xx,), {"how": "notamethod"})]:
+            self.assertRaises(ValueError, self.ff, *args, **kwargs)
 
     def test_prolong(self):
         for k in [0, 1, 20, self.ff.size, 200]:
             self.assertEquals(self.ff.prolong(k).size, k)
             
     def test_vscale_empty(self):
-        gg = Chebtech2(np.array([]))
-        self.assertEquals(gg.vscale, 0.)
+        self.assertEquals(self.emptyfun.vscale, 0.)
 
     def test_copy(self):
         ff = self.ff
@@ -193,44 +242,28 @@ class ClassUsage(unittest.TestCase):
         self.assertEquals( infnorm(ff.coeffs - gg.coeffs), 0)
 
     def test_simplify(self):
-        gg = self.ff.simplify()
+        # this test writes into the simplified chebtech, so use a local
+        # chebtech rather than the one shared by the class
+        ff = self.ff.copy()
+        gg = ff.simplify()
         # check that simplify is calling standard_chop underneath
-        self.assertEqual(gg.size, standard_chop(self.ff.coeffs))
-        self.assertEqual(infnorm(self.ff.coeffs[:gg.size]-gg.coeffs), 0)
+        self.assertEqual(gg.size, standard_chop(ff.coeffs))
+        self.assertEqual(infnorm(ff.coeffs[:gg.size]-gg.coeffs), 0)
         # check we are returned a copy of self's coeffcients by changing
         # one entry of gg
-        fcfs = self.ff.coeffs
+        fcfs = ff.coeffs
         gcfs = gg.coeffs
         self.assertEqual((fcfs[:gg.size]-gcfs).sum(),0)
         gg.coeffs[0] = 1
         self.assertNotEqual((fcfs[:gg.size]-gcfs).sum(),0)
 
-# --------------------------------------
-#          vscale estimates
-# --------------------------------------
-vscales = [
-    # (function, number of points, vscale)
-    (lambda x: sin(4*pi*x),        40, 1),
-    (lambda x: cos(x),             15, 1),
-    (lambda x: cos(4*pi*x),        39, 1),
-    (lambda x: exp(cos(4*pi*x)),  181, exp(1)),
-    (lambda x: cos(3244*x),      3389, 1),
-    (lambda x: exp(x),             15, exp(1)),
-    (lambda x: 1e10*exp(x),        15, 1e10*exp(1)),
-    (lambda x: 0*x+1.,              1, 1),
-]
-
-def definiteIntegralTester(fun, n, vscale):
-    ff = Chebtech2.initfun_fixedlen(fun, n)
-    def tester(self):
-        absdiff = abs(ff.vscale-vscale)
-        self.assertLessEqual(absdiff, .1*vscale)
-    return tester
+    def test_vscale(self):
+        for k, (fun, n, vscale) in enumerate(vscales):
+            with self.subTest(k=k):
+                ff = _get_fixedlen(fun, n)
+                absdiff = abs(ff.vscale-vscale)
+                self.assertLessEqual(absdiff, .1*vscale)
 
-for k, args in enumerate(vscales):
-    _testfun_ = definiteIntegralTester(*args)
-    _testfun_.__name__ = "test_vscale_{:02}".format(k)
-    setattr(ClassUsage, _testfun_.__name__, _testfun_)
 
 
 class Plotting(unittest.TestCase):
@@ -242,121 +275,115 @@ class Plotting(unittest.TestCase):
         self.f1 = Chebtech2.initfun_adaptive(f)
 
     def test_plot(self):
-        fig, ax = plt.subplots()
+        ax = Figure().subplots()
         self.f0.plot(ax=ax)
 
     def test_plotcoeffs(self):
-        fig, ax = plt.subplots()
+        ax = Figure().subplots()
         self.f0.plotcoeffs(ax=ax)
         self.f1.plotcoeffs(ax=ax, color="r")
 
 
 
-class Calculus(unittest.TestCase):
-    """Unit-tests for Chebtech2 calculus operations"""
-
-    def setUp(self):
-        self.emptyfun = Chebtech2(np.array([]))
-
-    # tests for the correct results in the empty cases
-    def test_sum_empty(self):
-        self.assertEqual(self.emptyfun.sum(),0)
-
-    def test_cumsum_empty(self):
-        self.assertTrue(self.emptyfun.cumsum().isempty)
-
-    def test_diff_empty(self):
-        self.assertTrue(self.emptyfun.diff().isempty)
-
 # --------------------------------------
 #           definite integrals
 # --------------------------------------
 def_integrals = [
     # (function, number of points, integral, tolerance)
-    (lambda x: sin(x),             14,                    .0,      eps),
-    (lambda x: sin(4*pi*x),        40,                    .0,  1e1*eps),
-    (lambda x: cos(x),             15,     1.682941969615793,    2*eps),
-    (lambda x: cos(4*pi*x),        39,                    .0,    2*eps),
+    (_sin,                         14,                    .0,      eps),
+    (_sin4pi,                      40,                    .0,  1e1*eps),
+    (_cos,                         15,     1.682941969615793,    2*eps),
+    (_cos4pi,                      39,                    .0,    2*eps),
     (lambda x: exp(cos(4*pi*x)),  182,     2.532131755504016,    4*eps),
-    (lambda x: cos(3244*x),      3389, 5.879599674161602e-04,  5e2*eps),
-    (lambda x: exp(x),             15,        exp(1)-exp(-1),    2*eps),
-    (lambda x: 1e10*exp(x),        15, 1e10*(exp(1)-exp(-1)), 4e10*eps),
-    (lambda x: 0*x+1.,              1,                     2,      eps),
+    (_cos3244,                   3389, 5.879599674161602e-04,  5e2*eps),
+    (_exp,                         15,        exp(1)-exp(-1),    2*eps),
+    (_exp1e10,                     15, 1e10*(exp(1)-exp(-1)), 4e10*eps),
+    (_const,                        1,                     2,      eps),
 ]
 
-def definiteIntegralTester(fun, n, integral, tol):
-    ff = Chebtech2.initfun_fixedlen(fun, n)
-    def tester(self):
-        absdiff = abs(ff.sum()-integral)
-        self.assertLessEqual(absdiff, tol)
-    return tester
-
-for k, (fun, n, integral, tol) in enumerate(def_integrals):
-    _testfun_ = definiteIntegralTester(fun, n, integral, tol)
-    _testfun_.__name__ = "test_sum_{:02}".format(k)
-    setattr(Calculus, _testfun_.__name__, _testfun_)
-
 # --------------------------------------
 #          indefinite integrals
 # --------------------------------------
 indef_integrals = [
     # (function, indefinite integral, number of points, tolerance)
-    (lambda x: 0*x+1.,      lambda x: x,              1,         eps),
-    (lambda x: x,           lambda x: 1/2*x**2,       2,       2*eps),
-    (lambda x: x**2,        lambda x: 1/3*x**3,       3,       2*eps),
-    (lambda x: x**3,        lambda x: 1/4*x**4,       4,       2*eps),
-    (lambda x: x**4,        lambda x: 1/5*x**5,       5,       2*eps),
-    (lambda x: x**5,        lambda x: 1/6*x**6,       6,       4*eps),
-    (lambda x: sin(x),      lambda x: -cos(x),       16,       2*eps),
-    (lambda x: cos(3*x),    lambda x: 1./3*sin(3*x), 23,       2*eps),
-    (lambda x: exp(x),      lambda x: exp(x),        16,       3*eps),
-    (lambda x: 1e10*exp(x), lambda x: 1e10*exp(x),   16, 1e10*(3*eps)),
+    (_const,                _x,                       1,         eps),
+    (_x,                    lambda x: 1/2*x**2,       2,       2*eps),
+    (_x2,                   lambda x: 1/3*x**3,       3,       2*eps),
+    (_x3,                   lambda x: 1/4*x**4,       4,       2*eps),
+    (_x4,                   lambda x: 1/5*x**5,       5,       2*eps),
+    (_x5,                   lambda x: 1/6*x**6,       6,       4*eps),
+    (_sin,                  lambda x: -cos(x),       16,       2*eps),
+    (_cos3,                 lambda x: 1./3*sin(3*x), 23,       2*eps),
+    (_exp,                  _exp,                    16,       3*eps),
+    (_exp1e10,              _exp1e10,                16, 1e10*(3*eps)),
 ]
 
-def indefiniteIntegralTester(fun, dfn, n, tol):
-    ff = Chebtech2.initfun_fixedlen(fun, n)
-    gg = Chebtech2.initfun_fixedlen(dfn, n+1)
-    coeffs = gg.coeffs
-    coeffs[0] = coeffs[0] - dfn(np.array([-1]))
-    def tester(self):
-        absdiff = infnorm(ff.cumsum().coeffs - coeffs)
-        self.assertLessEqual(absdiff, tol)
-    return tester
-
-for k, (fun, dfn, n, tol) in enumerate(indef_integrals):
-    _testfun_ = indefiniteIntegralTester(fun, dfn, n, tol)
-    _testfun_.__name__ = "test_cumsum_{:02}".format(k)
-    setattr(Calculus, _testfun_.__name__, _testfun_)
-
 # --------------------------------------
 #            derivatives
 # --------------------------------------
 derivatives = [
     # (function, derivative, number of points, tolerance)
-    (lambda x: 0*x+1.,      lambda x: 0*x+0,        1,          eps),
-    (lambda x: x,           lambda x: 0*x+1,        2,        2*eps),
-    (lambda x: x**2,        lambda x: 2*x,          3,        2*eps),
-    (lambda x: x**3,        lambda x: 3*x**2,       4,        2*eps),
-    (lambda x: x**4,        lambda x: 4*x**3,       5,        3*eps),
-    (lambda x: x**5,        lambda x: 5*x**4,       6,        4*eps),
-    (lambda x: sin(x),      lambda x: cos(x),      16,      5e1*eps),
-    (lambda x: cos(3*x),    lambda x: -3*sin(3*x), 23,      5e2*eps),
-    (lambda x: exp(x),      lambda x: exp(x),      16,      2e2*eps),
-    (lambda x: 1e10*exp(x), lambda x: 1e10*exp(x), 16, 1e10*2e2*eps),
+    (_const,                lambda x: 0*x+0,        1,          eps),
+    (_x,                    _const,                 2,        2*eps),
+    (_x2,                   lambda x: 2*x,          3,        2*eps),
+    (_x3,                   lambda x: 3*x**2,       4,        2*eps),
+    (_x4,                   lambda x: 4*x**3,       5,        3*eps),
+    (_x5,                   lambda x: 5*x**4,       6,        4*eps),
+    (_sin,                  _cos,                  16,      5e1*eps),
+    (_cos3,                 lambda x: -3*sin(3*x), 23,      5e2*eps),
+    (_exp,                  _exp,                  16,      2e2*eps),
+    (_exp1e10,              _exp1e10,              16, 1e10*2e2*eps),
 ]
 
-def derivativeTester(fun, der, n, tol):
-    ff = Chebtech2.initfun_fixedlen(fun, n)
-    gg = Chebtech2.initfun_fixedlen(der, max(n-1,1))
-    def tester(self):
-        absdiff = infnorm(ff.diff().coeffs - gg.coeffs)
-        self.assertLessEqual(absdiff, tol)
-    return tester
+# scratch space for the coefficient differences in the cumsum/diff tests
+_SCRATCH = np.empty(max(n for (_, _, n, _) in indef_integrals+derivatives)+1)
+
+def _coeffdiff(a, b):
+    out = _SCRATCH[:b.size]
+    return np.subtract(a, b, out=out)
+
+class Calculus(unittest.TestCase):
+    """Unit-tests for Chebtech2 calculus operations"""
+
+    emptyfun = _EMPTY
+
+    # tests for the correct results in the empty cases
+    def test_sum_empty(self):
+        self.assertEqual(self.emptyfun.sum(),0)
+
+    def test_cumsum_empty(self):
+        self.assertTrue(self.emptyfun.cumsum().isempty)
+
+    def test_diff_empty(self):
+        self.assertTrue(self.emptyfun.diff().isempty)
+
+    def test_sum(self):
+        for k, (fun, n, integral, tol) in enumerate(def_integrals):
+            with self.subTest(k=k):
+                ff = _get_fixedlen(fun, n)
+                absdiff = abs(ff.sum()-integral)
+                self.assertLessEqual(absdiff, tol)
+
+    def test_cumsum(self):
+        for k, (fun, dfn, n, tol) in enumerate(indef_integrals):
+            with self.subTest(k=k):
+                ff = _get_fixedlen(fun, n)
+                gg = _get_fixedlen(dfn, n+1)
+                coeffs = gg.coeffs.copy()
+                coeffs[0] = coeffs[0] - dfn(np.array([-1]))
+                absdiff = infnorm(_coeffdiff(ff.cumsum().coeffs, coeffs))
+                self.assertLessEqual(absdiff, tol)
+
+    def test_diff(self):
+        for k, (fun, der, n, tol) in enumerate(derivatives):
+            with self.subTest(k=k):
+                ff = _get_fixedlen(fun, n)
+                gg = _get_fixedlen(der, max(n-1,1))
+                absdiff = infnorm(_coeffdiff(ff.diff().coeffs, gg.coeffs))
+                self.assertLessEqual(absdiff, tol)
+
+
 
-for k, (fun, der, n, tol) in enumerate(derivatives):
-    _testfun_ = derivativeTester(fun, der, n, tol)
-    _testfun_.__name__ = "test_diff_{:02}".format(k)
-    setattr(Calculus, _testfun_.__name__, _testfun_)
 
 
 class Construction(unittest.TestCase):
@@ -401,38 +428,46 @@ class Construction(unittest.TestCase):
         self.assertTrue(ff.isempty)
         self.assertRaises(TypeError, Chebtech2.initempty, [1.])
 
-def adaptiveTester(fun, funlen):
-    ff = Chebtech2.initfun_adaptive(fun)
-    def tester(self):
-        self.assertEquals(ff.size, funlen)
-    return tester
+    def test_adaptive(self):
+        for (fun, funlen, _) in testfunctions:
+            with self.subTest(fun=fun.__name__):
+                self.assertEquals(_get_adaptive(fun).size, funlen)
 
-def fixedlenTester(fun, n):
-    ff = Chebtech2.initfun_fixedlen(fun, n)
-    def tester(self):
-        self.assertEquals(ff.size, n)
-    return tester
+    def test_fixedlen(self):
+        for (fun, _, _) in testfunctions:
+            for n in (50, 500):
+                with self.subTest(fun=fun.__name__, n=n):
+                    self.assertEquals(_get_fixedlen(fun, n).size, n)
 
-for (fun, funlen, _) in testfunctions:
 
-    # add the adaptive tests
-    _testfun_ = adaptiveTester(fun, funlen)
-    _testfun_.__name__ = "test_adaptive_{}".format(fun.__name__)
-    setattr(Construction, _testfun_.__name__, _testfun_)
+# note: defining __radd__(a,b) = operator.add(b,a) and feeding this into the
+# test will not in fact test the __radd__ functionality of the class. These
+# test need to be added manually to the class.
+binops = (operator.add, operator.mul, operator.sub, operator.truediv)
 
-    # add the fixedlen tests
-    for n in np.array([50, 500]):
-        _testfun_ = fixedlenTester(fun, n)
-        _testfun_.__name__ = \
-            "test_fixedlen_{}_{:003}pts".format(fun.__name__, n)
-        setattr(Construction, _testfun_.__name__, _testfun_)
+powtestfuns = (
+    [(np.exp, 15, 'exp'), (np.sin, 15, 'sin')],
+    [(np.exp, 15, 'exp'), (lambda x: 2-x, 2, 'linear')],
+    [(lambda x: 2-x, 2, 'linear'), (np.exp, 15, 'exp')],
+)
 
+unaryops = (operator.pos, operator.neg)
 
 class Algebra(unittest.TestCase):
     """Unit-tests for Chebtech2 algebraic operations"""
-    def setUp(self):
-        self.xx = -1 + 2 * np.random.rand(1000)
-        self.emptyfun = Chebtech2.initempty()
+
+    emptyfun = _EMPTY
+
+    @classmethod
+    def setUpClass(cls):
+        cls.xx = xxpool
+        cls._fxx_cache = {}
+
+    # values of the test function f at self.xx, computed once per function
+    def _fxx(self, f):
+        if f not in self._fxx_cache:
+            self._fxx_cache[f] = f(self.xx)
+        return self._fxx_cache[f]
 
     # check (empty Chebtech) + (Chebtech) = (empty Chebtech)
     #   and (Chebtech) + (empty Chebtech) = (empty Chebtech)
@@ -447,14 +482,14 @@ class Algebra(unittest.TestCase):
     def test__add__radd__constant(self):
         xx = self.xx
         for (fun, funlen, _) in testfunctions:
+            techfun = Chebtech2.initfun_fixedlen(fun, funlen)
+            fxx = self._fxx(fun)
             for const in (-1, 1, 10, -1e5):
-                f = lambda x: const + fun(x)
-                techfun = Chebtech2.initfun_fixedlen(fun, funlen)
                 f1 = const + techfun
                 f2 = techfun + const
                 tol = 5e1 * eps * abs(const)
-                self.assertLessEqual(infnorm(f(xx)-f1(xx)), tol)
-                self.assertLessEqual(infnorm(f(xx)-f2(xx)), tol)
+                self.assertLessEqual(infnorm(const+fxx-f1(xx)), tol)
+                self.assertLessEqual(infnorm(const+fxx-f2(xx)), tol)
 
     # check (empty Chebtech) - (Chebtech) = (empty Chebtech)
     #   and (Chebtech) - (empty Chebtech) = (empty Chebtech)
@@ -469,15 +504,14 @@ class Algebra(unittest.TestCase):
     def test__sub__rsub__constant(self):
         xx = self.xx
         for (fun, funlen, _) in testfunctions:
+            techfun = Chebtech2.initfun_fixedlen(fun, funlen)
+            fxx = self._fxx(fun)
             for const in (-1, 1, 10, -1e5):
-                techfun = Chebtech2.initfun_fixedlen(fun, funlen)
-                f = lambda x: const - fun(x)
-                g = lambda x: fun(x) - const
                 ff = const - techfun
                 gg = techfun - const
                 tol = 5e1 * eps * abs(const)
-                self.assertLessEqual(infnorm(f(xx)-ff(xx)), tol)
-                self.assertLessEqual(infnorm(g(xx)-gg(xx)), tol)
+                self.assertLessEqual(infnorm((const-fxx)-ff(xx)), tol)
+                self.assertLessEqual(infnorm((fxx-const)-gg(xx)), tol)
 
     # check (empty Chebtech) * (Chebtech) = (empty Chebtech)
     #   and (Chebtech) * (empty Chebtech) = (empty Chebtech)
@@ -492,15 +526,14 @@ class Algebra(unittest.TestCase):
     def test__mul__rmul__constant(self):
         xx = self.xx
         for (fun, funlen, _) in testfunctions:
+            techfun = Chebtech2.initfun_fixedlen(fun, funlen)
+            fxx = self._fxx(fun)
             for const in (-1, 1, 10, -1e5):
-                techfun = Chebtech2.initfun_fixedlen(fun, funlen)
-                f = lambda x: const * fun(x)
-                g = lambda x: fun(x) * const
                 ff = const * techfun
                 gg = techfun * const
                 tol = 5e1 * eps * abs(const)
-                self.assertLessEqual(infnorm(f(xx)-ff(xx)), tol)
-                self.assertLessEqual(infnorm(g(xx)-gg(xx)), tol)
+                self.assertLessEqual(infnorm(const*fxx-ff(xx)), tol)
+                self.assertLessEqual(infnorm(fxx*const-gg(xx)), tol)
 
     # check (empty Chebtech) / (Chebtech) = (empty Chebtech)
     #   and (Chebtech) / (empty Chebtech) = (empty Chebtech)
@@ -521,17 +554,16 @@ class Algebra(unittest.TestCase):
     def test_truediv_constant(self):
         xx = self.xx
         for (fun, funlen, hasRoots) in testfunctions:
+            techfun = Chebtech2.initfun_fixedlen(fun, funlen)
+            fxx = self._fxx(fun)
             for const in (-1, 1, 10, -1e5):
                 tol = eps*abs(const)
-                techfun = Chebtech2.initfun_fixedlen(fun, funlen)
-                g = lambda x: fun(x) / const
                 gg = techfun / const
-                self.assertLessEqual(infnorm(g(xx)-gg(xx)), 2*gg.size*tol)
+                self.assertLessEqual(infnorm(fxx/const-gg(xx)), 2*gg.size*tol)
                 # don't do the following test for functions with roots
                 if not hasRoots:
-                    f = lambda x: const / fun(x)
                     ff = const / techfun
-                    self.assertLessEqual(infnorm(f(xx)-ff(xx)), 3*ff.size*tol)
+                    self.assertLessEqual(infnorm(const/fxx-ff(xx)), 3*ff.size*tol)
 
     # check    +(empty Chebtech) = (empty Chebtech)
     def test__pos__empty(self):
@@ -554,103 +586,59 @@ class Algebra(unittest.TestCase):
     def test_pow_const(self):
         xx = self.xx
         for (fun, funlen) in [(np.sin, 15), (np.exp,15)]:
+            techfun = Chebtech2.initfun_fixedlen(fun, funlen)
+            fxx = self._fxx(fun)
             for c in (1, 2):
-                techfun = Chebtech2.initfun_fixedlen(fun, funlen)
-                f = lambda x: fun(x) ** c
                 ff = techfun ** c
                 tol = 2e1 * eps * abs(c)
-                self.assertLessEqual(infnorm(f(xx)-ff(xx)), tol)
+                self.assertLessEqual(infnorm(fxx**c-ff(xx)), tol)
 
     def test_rpow_const(self):
         xx = self.xx
         for (fun, funlen) in [(np.sin, 15), (np.exp,15)]:
+            techfun = Chebtech2.initfun_fixedlen(fun, funlen)
+            fxx = self._fxx(fun)
             for c in (1, 2):
-                techfun = Chebtech2.initfun_fixedlen(fun, funlen)
-                g = lambda x: c ** fun(x)
                 gg = c ** techfun
                 tol = 2e1 * eps * abs(c)
-                self.assertLessEqual(infnorm(g(xx)-gg(xx)), tol)
-
-# add tests for the binary operators
-def binaryOpTester(f, g, binop, nf, ng):
-    ff = Chebtech2.initfun_fixedlen(f, nf)
-    gg = Chebtech2.initfun_fixedlen(g, ng)
-    FG = lambda x: binop(f(x),g(x)) 
-    fg = binop(ff, gg)
-    def tester(self):
+                self.assertLessEqual(infnorm(c**fxx-gg(xx)), tol)
+
+    # check binop(ff, gg) against binop(f, g) on xx
+    def _binop_check(self, f, g, binop, nf, ng):
+        ff = _get_fixedlen(f, nf)
+        gg = _get_fixedlen(g, ng)
+        fg = binop(ff, gg)
+        FG = binop(self._fxx(f), self._fxx(g))
         vscl = max([ff.vscale, gg.vscale])
         lscl = max([ff.size, gg.size])
-        self.assertLessEqual(infnorm(fg(self.xx)-FG(self.xx)), 3*vscl*lscl*eps)
+        self.assertLessEqual(infnorm(fg(self.xx)-FG), 3*vscl*lscl*eps)
         if binop is operator.mul:
             # check simplify is not being called in __mul__
             self.assertEqual(fg.size, ff.size+gg.size-1)
-    return tester
 
-# note: defining __radd__(a,b) = operator.add(b,a) and feeding this into the
-# test will not in fact test the __radd__ functionality of the class. These
-# test need to be added manually to the class.
-binops = (operator.add, operator.mul, operator.sub, operator.truediv)
-for binop in binops:
-    # add generic binary operator tests
-    for (f, nf, _), (g, ng, denomRoots) in \
-            itertools.combinations(testfunctions, 2):
-        if binop is operator.truediv and denomRoots:
-            # skip truediv test if the denominator has roots
-            pass
-        else:
-            _testfun_ = binaryOpTester(f, g, binop, nf, ng)
-            _testfun_.__name__ = \
-                "test_{}_{}_{}".format(binop.__name__, f.__name__,  g.__name__)
-            setattr(Algebra, _testfun_.__name__, _testfun_)
-
-powtestfuns = (
-    [(np.exp, 15, 'exp'), (np.sin, 15, 'sin')],
-    [(np.exp, 15, 'exp'), (lambda x: 2-x, 2, 'linear')],
-    [(lambda x: 2-x, 2, 'linear'), (np.exp, 15, 'exp')],
-)
-# add operator.power tests
-for (f, nf, namef), (g, ng, nameg) in powtestfuns:
-    _testfun_ = binaryOpTester(f, g, operator.pow, nf, ng)
-    _testfun_.__name__ = \
-        "test_{}_{}_{}".format('pow', namef,  nameg)
-    setattr(Algebra, _testfun_.__name__, _testfun_)
-
-# add tests for the unary operators
-def unaryOpTester(unaryop, f, nf):
-    ff = Chebtech2.initfun_fixedlen(f, nf)
-    gg = lambda x: unaryop(f(x))
-    GG = unaryop(ff)
-    def tester(self):
-        self.assertLessEqual(infnorm(gg(self.xx)-GG(self.xx)), 4e1*eps)
-    return tester
-
-unaryops = (operator.pos, operator.neg)
-for unaryop in unaryops:
-    for (f, nf, _) in testfunctions:
-        _testfun_ = unaryOpTester(unaryop, f, nf)
-        _testfun_.__name__ = \
-            "test_{}_{}".format(unaryop.__name__, f.__name__)
-        setattr(Algebra, _testfun_.__name__, _testfun_)
-
-class Roots(unittest.TestCase):
-
-    def test_empty(self):
-        ff = Chebtech2.initempty()
-        self.assertEquals(ff.roots().size, 0)
-
-    def test_const(self):
-        ff = Chebtech2.initconst(0.)
-        gg = Chebtech2.initconst(2.)
-        self.assertEquals(ff.roots().size, 0)
-        self.assertEquals(gg.roots().size, 0)
-
-# add tests for roots
-def rootsTester(f, roots, tol):
-    ff = Chebtech2.initfun_adaptive(f)
-    rts = ff.roots()
-    def tester(self):
-        self.assertLessEqual(infnorm(rts-roots), tol)
-    return tester
+    def test_binops(self):
+        for binop in binops:
+            for (f, nf, _), (g, ng, denomRoots) in \
+                    itertools.combinations(testfunctions, 2):
+                if binop is operator.truediv and denomRoots:
+                    # skip truediv test if the denominator has roots
+                    continue
+                with self.subTest(binop=binop.__name__, f=f.__name__,
+                                  g=g.__name__):
+                    self._binop_check(f, g, binop, nf, ng)
+
+    def test_pow(self):
+        for (f, nf, namef), (g, ng, nameg) in powtestfuns:
+            with self.subTest(f=namef, g=nameg):
+                self._binop_check(f, g, operator.pow, nf, ng)
+
+    def test_unaryops(self):
+        for unaryop in unaryops:
+            for (f, nf, _) in testfunctions:
+                with self.subTest(unaryop=unaryop.__name__, f=f.__name__):
+                    GG = unaryop(_get_fixedlen(f, nf))
+                    gg = unaryop(self._fxx(f))
+                    self.assertLessEqual(infnorm(gg-GG(self.xx)), 4e1*eps)
 
 rootstestfuns = (
     (lambda x: 3*x+2.,        np.array([-2/3]),                       1*eps),
@@ -662,10 +650,21 @@ rootstestfuns = (
     (lambda x: sin(5*pi/2*x), np.array([-.8, -.4, 0, .4, .8]),        1*eps)
     )
 
-for k, args in enumerate(rootstestfuns):
-    _testfun_ = rootsTester(*args)
-    _testfun_.__name__ = "test_roots_{}".format(k)
-    setattr(Roots, _testfun_.__name__, _testfun_)
+class Roots(unittest.TestCase):
+
+    emptyfun = _EMPTY
+
+    def test_empty(self):
+        self.assertEquals(self.emptyfun.roots().size, 0)
+
+    def test_const(self):
+        ff = Chebtech2.initconst(0.)
+        gg = Chebtech2.initconst(2.)
+        self.assertEquals(ff.roots().size, 0)
+        self.assertEquals(gg.roots().size, 0)
 
-# reset the testsfun variable so it doesn't get picked up by nose
-_testfun_ = None
+    def test_roots(self):
+        for k, (f, roots, tol) in enumerate(rootstestfuns):
+            with self.subTest(k=k):
+                rts = _get_adaptive(f).roots()
+                self.assertLessEqual(infnorm(rts-roots), tol)
@@ -118,7 +118,8 @@ class TestDomain(unittest.TestCase):
         self.assertRaises(InvalidDomain, Domain, [1])
         self.assertRaises(InvalidDomain, Domain, [1, -1])
         self.assertRaises(InvalidDomain, Domain, [-1, 0, 0])
-        self.assertRaises(ValueError, Domain, ["a", "b"])
+        self.assertRaises(InvalidDomain, Domain, ["a", "b"])
+        self.assertRaises(InvalidDomain, Domain, [[-1, 0], 1])
 
     def test__iter__(self):
         dom_a = Domain([-2,1])
@@ -250,6 +251,17 @@ class TestDomain(unittest.TestCase):
         self.assertTrue(np.all(dom_b.support.view(np.ndarray)==[-2,1]))
         self.assertTrue(np.all(dom_c.support.view(np.ndarray)==[-10,10]))
 
+    # a Domain wraps the array it is given, so the support must follow any
+    # in-place change to that array
+    def test_support_after_mutation(self):
+        bpts = np.array([-1.,0.,1.])
+        dom = Domain(bpts)
+        dom.support
+        bpts[-1] = 2.
+        self.assertTrue(np.all(dom.support.view(np.ndarray)==[-1,2]))
+        dom_u = dom.union(Domain([-1.,2.]))
+        self.assertTrue(np.all(dom_u.view(np.ndarray)==[-1,0,2]))
+
     def test_size(self):
         dom_a = Domain([-2,1])
         dom_b = Domain([-2,0,1])
@@ -284,6 +296,14 @@ class TestDomain(unittest.TestCase):
         dom_b = Domain([-1.5,-.5,0.5])
         self.assertEqual(dom_b.merge(dom_a), Domain([-2,-1.5,-1,-.5,0,.5,1]))
 
+    def test_merge_duplicates(self):
+        tol = .8*HTOL
+        dom_a = Domain([-2,-1,0,1])
+        dom_b = Domain([-1,0+tol,1])
+        self.assertEqual(dom_a.merge(dom_b).size, 4)
+        self.assertEqual(dom_a.merge(dom_b), dom_a)
+        self.assertEqual(dom_a.merge(dom_a), dom_a)
+
     def test_union(self):
         dom_a = Domain([-2,0,2])
         dom_b = Domain([-2,-1,1,2])
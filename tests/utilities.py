@@ -5,6 +5,12 @@ import numpy as np
 eps = np.finfo(float).eps
 
 def infnorm(x):
+    x = np.asarray(x)
+    # for float vectors take the extremes directly rather than allocating
+    # the intermediate abs(x) array that norm(x, inf) builds (negating the
+    # minimum is not safe for unsigned integer or boolean arrays)
+    if x.ndim == 1 and np.issubdtype(x.dtype, np.floating):
+        return max(x.max(), -x.min())
     return np.linalg.norm(x, np.inf)
 
 def scaled_tol(n):